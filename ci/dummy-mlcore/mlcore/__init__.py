@@ -1,33 +1,72 @@
 from __future__ import annotations
 
-import json
 import logging
-from dataclasses import dataclass, asdict
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    from ._card import ModelCard
+
+# json/orjson and dataclasses load on first use, so importing mlcore just for
+# get_logger stays cheap for short-lived CLI scripts.
+_codec: tuple[Callable[[bytes], Any], Callable[[Any], bytes]] | None = None
+
+
+def __getattr__(name: str) -> Any:
+    if name == "ModelCard":
+        from ._card import ModelCard
+
+        return ModelCard
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+def _get_codec() -> tuple[Callable[[bytes], Any], Callable[[Any], bytes]]:
+    global _codec
+    if _codec is None:
+        import json
+
+        def _dumps(data: Any) -> bytes:
+            # Always json: orjson would write NaN/Infinity as null and reject
+            # big ints, so the file contents must not depend on it being installed.
+            return json.dumps(data).encode("utf-8")
+
+        try:  # optional C-accelerated parser; reads only
+            import orjson
+        except ImportError:
+            _codec = (json.loads, _dumps)
+        else:
+
+            def _loads(raw: bytes) -> Any:
+                try:
+                    return orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # NaN/Infinity, >64-bit ints, etc.: json accepts what it wrote
+                    return json.loads(raw)
+
+            _codec = (_loads, _dumps)
+    return _codec
+
+
 def read_json(path: str | Path) -> Dict[str, Any]:
-    p = Path(path)
-    return json.loads(p.read_text()) if p.exists() else {}
+    loads, _ = _get_codec()
+    try:
+        with open(path, "rb") as f:
+            return loads(f.read())
+    except FileNotFoundError:
+        return {}
 
 
 def write_json(path: str | Path, data: Dict[str, Any]) -> None:
+    _, dumps = _get_codec()
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(data))
-
-
-@dataclass
-class ModelCard:
-    name: str
-    version: str
-    metrics: Dict[str, Any]
+    with open(p, "wb", buffering=65536) as f:
+        f.write(dumps(data))
 
-    def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
 
+__all__ = ["ModelCard", "get_logger", "read_json", "write_json"]
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict
+
+
+@dataclass
+class ModelCard:
+    name: str
+    version: str
+    metrics: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Flat literal instead of asdict(): skips its recursive deepcopy.
+        # metrics is still copied so callers can't mutate the card through it.
+        return {"name": self.name, "version": self.version, "metrics": dict(self.metrics)}
@@ -16,111 +16,288 @@ and control how `mlcore` is installed.
 from __future__ import annotations
 
 import argparse
+import functools
+import importlib.util
+import json
 import os
+import shlex
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import re
 
+# Placeholder substituted by the notebook fallback render in main()
+_PKG_NAME_RE = re.compile(rb"{{\s*package_name\s*}}")
+_PY_NAME_RE = re.compile(r"python(\d+\.\d+)[a-z]*(?:\.exe)?")
+# `py -0p` lines, old and new launcher formats:
+#   " -3.11-64        C:\Python311\python.exe *"
+#   " -V:3.11 *        C:\Python311\python.exe"
+_PY_LAUNCHER_RE = re.compile(
+    r"^\s*-(?:V:)?(?P<ver>\d+\.\d+)\S*\s+(?:\*\s+)?(?P<path>.+?)(?:\s+\*)?\s*$"
+)
+
+
+@functools.cache
+def _which(name: str) -> str | None:
+    """Memoized shutil.which: each name walks PATH at most once per run."""
+    return shutil.which(name)
+
 
 def run(cmd: list[str], cwd: Path | None = None, env: dict[str, str] | None = None) -> None:
+    """Run `cmd` with inherited stdio, raising CalledProcessError on failure.
+
+    Leave `env` as None unless it actually differs from os.environ: the child
+    then inherits the parent environment directly instead of receiving a
+    rebuilt envp array. Avoid adding `preexec_fn`/`start_new_session` here so
+    CPython can keep using its posix_spawn/vfork fast path.
+    """
     print(f"[cmd] {' '.join(cmd)}" + (f"  (cwd={cwd})" if cwd else ""))
-    subprocess.check_call(cmd, cwd=str(cwd) if cwd else None, env=env)
+    subprocess.run(cmd, cwd=str(cwd) if cwd else None, env=env, check=True)
+
+
+def _probe_version(exe: str) -> str | None:
+    try:
+        return subprocess.check_output(
+            [exe, "-c", "import sys; print(f'{sys.version_info[0]}.{sys.version_info[1]}')"],
+            text=True,
+            bufsize=-1,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except Exception:
+        return None
 
 
 def which_python_311() -> str | None:
     """Find a Python 3.11 interpreter path on this system.
 
+    - Reuse the path cached by a previous run while the file is unchanged.
     - On Windows, try the py launcher to locate the exact exe.
-    - Else, try common names and validate the version.
+    - Else, probe common names concurrently and validate the version.
     """
+    cache_file = user_cache_dir() / "py311.json"
+    cached = _read_cache_meta(cache_file)
+    path = cached.get("path")
+    # Stamp-checked rather than re-derived: the cache must also cover shims and
+    # `python.exe`-style names whose version can only be learned by probing.
+    if path and cached.get("version") == "3.11" and cached.get("stamp") == _file_stamp(path):
+        return path
+
+    found = _find_python_311()
+    if found:
+        # Cache the resolved file, not a shim or alias that may retarget later
+        found = os.path.realpath(found)
+        stamp = _file_stamp(found)
+        if stamp:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(
+                    json.dumps({"path": found, "version": "3.11", "stamp": stamp}),
+                    encoding="utf-8",
+                )
+            except OSError:
+                pass
+    return found
+
+
+def _file_stamp(path: str) -> str | None:
+    """Identity of the file at `path` (mtime and size), or None if it is gone."""
     try:
-        if os.name == "nt":
-            # Ask the Windows launcher where 3.11 lives
-            out = subprocess.check_output(
-                ["py", "-3.11", "-c", "import sys; print(sys.executable)"] ,
-                text=True,
-                stderr=subprocess.DEVNULL,
-            ).strip()
-            if out and Path(out).exists():
-                return out
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _version_from_path(exe: str) -> str | None:
+    """Infer `X.Y` from an interpreter's on-disk layout without starting it.
+
+    Looks at the resolved executable name (`python3.11`) and, failing that, at
+    a single `lib/pythonX.Y` directory next to it. Returns None when ambiguous.
+    """
+    real = Path(os.path.realpath(exe))
+    m = _PY_NAME_RE.fullmatch(real.name)
+    if m:
+        return m.group(1)
+    libs = {
+        m.group(1)
+        for p in real.parent.parent.glob("lib/python*")
+        if (m := _PY_NAME_RE.fullmatch(p.name))
+    }
+    if len(libs) == 1:
+        return libs.pop()
+    return None
+
+
+def _windows_pythons() -> dict[str, str]:
+    """Map `X.Y` -> executable for every install the py launcher knows about."""
+    try:
+        out = subprocess.check_output(
+            ["py", "-0p"], text=True, bufsize=-1, stderr=subprocess.DEVNULL
+        )
     except Exception:
-        pass
+        return {}
+    found: dict[str, str] = {}
+    for line in out.splitlines():
+        m = _PY_LAUNCHER_RE.match(line)
+        if m:
+            found.setdefault(m.group("ver"), m.group("path"))
+    return found
+
+
+def _find_python_311() -> str | None:
+    if os.name == "nt":
+        # One launcher call lists all installs; no per-candidate probing
+        out = _windows_pythons().get("3.11")
+        if out and Path(out).exists():
+            return out
 
     candidates = [
         "python3.11",
         "python3",
         "python",
     ]
-    for cand in candidates:
-        exe = shutil.which(cand)
-        if not exe:
-            continue
-        try:
-            ver = subprocess.check_output(
-                [exe, "-c", "import sys; print(f'{sys.version_info[0]}.{sys.version_info[1]}')"],
-                text=True,
-                stderr=subprocess.DEVNULL,
-            ).strip()
-            if ver == "3.11":
-                return exe
-        except Exception:
-            continue
+    exes = [exe for exe in dict.fromkeys(_which(c) for c in candidates) if exe]
+    if not exes:
+        return None
+    # Reading the version off the filesystem is enough for most installs; only
+    # start interpreters whose layout is ambiguous, side by side, and keep the
+    # candidate preference order when picking a match.
+    versions = [_version_from_path(exe) for exe in exes]
+    unknown = [exe for exe, ver in zip(exes, versions, strict=True) if ver is None]
+    if unknown:
+        with ThreadPoolExecutor(max_workers=len(unknown)) as pool:
+            probed = dict(zip(unknown, pool.map(_probe_version, unknown), strict=True))
+        versions = [ver or probed[exe] for exe, ver in zip(exes, versions, strict=True)]
+    for exe, ver in zip(exes, versions, strict=True):
+        if ver == "3.11":
+            return exe
     return None
 
 
-def find_copier_cmd(repo_root: Path) -> list[str]:
+def user_cache_dir() -> Path:
+    """Per-user cache directory for artifacts that should outlive a single clone.
+
+    Uses `platformdirs` when importable; otherwise mirrors its defaults.
+    """
+    try:
+        from platformdirs import user_cache_dir as _user_cache_dir  # type: ignore[import-not-found]
+    except ImportError:
+        pass
+    else:
+        return Path(_user_cache_dir("ml-project-template"))
+
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        base = str(Path.home() / "Library" / "Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "ml-project-template"
+
+
+def _read_cache_meta(meta_path: Path) -> dict[str, str]:
+    try:
+        data = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _installed_copier_version(venv_dir: Path) -> str | None:
+    """Return the Copier version installed in `venv_dir`, read from its dist-info."""
+    if os.name == "nt":
+        pattern = "Lib/site-packages/copier-*.dist-info"
+    else:
+        pattern = "lib/python*/site-packages/copier-*.dist-info"
+    found = [p.name[len("copier-"):-len(".dist-info")] for p in venv_dir.glob(pattern)]
+    return found[0] if len(found) == 1 else None
+
+
+def find_copier_cmd() -> list[str]:
     """Find an invocation for Copier that works in this environment.
 
     Preference order:
       1) `copier` executable on PATH (pipx or pip install)
       2) `python3 -m copier` if available
       3) `python -m copier` if available
-      4) Bootstrap local venv under the repo and install copier
+      4) Cached bootstrap venv under the user cache dir (created on first use)
     """
-    exe = shutil.which("copier")
+    exe = _which("copier")
     if exe:
         return [exe]
 
     candidates = [
-        shutil.which("python3") or "python3",
-        shutil.which("python") or "python",
+        _which("python3") or "python3",
+        _which("python") or "python",
     ]
+    # Unresolved paths on purpose: a venv's bin/python symlinks to the base
+    # interpreter, but only the venv sees the venv's site-packages.
+    this_python = os.path.abspath(sys.executable)
     for cand in candidates:
+        if os.path.abspath(cand) == this_python:
+            # Same interpreter as ours: check in-process instead of spawning it
+            if importlib.util.find_spec("copier") is not None:
+                return [cand, "-m", "copier"]
+            continue
+        # Only the exit status matters: importing is enough, no CLI/version output
         try:
-            subprocess.check_call([cand, "-m", "copier", "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            return [cand, "-m", "copier"]
-        except Exception:
+            probe = subprocess.run(
+                [cand, "-c", "import copier"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            )
+        except OSError:
             continue
+        if probe.returncode == 0:
+            return [cand, "-m", "copier"]
 
-    # Bootstrap: create a minimal venv in the repo to host copier
-    bootstrap_dir = repo_root / ".bootstrap"
-    venv_dir = bootstrap_dir / "venv"
+    # Bootstrap: a venv hosting copier, shared across clones and keyed by the
+    # interpreter's major.minor so it is reused until the interpreter changes.
     python = sys.executable
-    try:
-        bootstrap_dir.mkdir(parents=True, exist_ok=True)
-        # Create venv if missing
-        if not (venv_dir / ("Scripts" if os.name == "nt" else "bin") / ("python.exe" if os.name == "nt" else "python")).exists():
-            subprocess.check_call([python, "-m", "venv", str(venv_dir)])
-        vpy, vpip = venv_paths(venv_dir)
+    venv_dir = user_cache_dir() / f"copier-venv-py{sys.version_info.major}.{sys.version_info.minor}"
+    meta_path = venv_dir / "cache_meta.json"
+    vpy, _ = venv_paths(venv_dir)
+
+    meta = _read_cache_meta(meta_path)
+    if meta.get("python") == python and vpy.exists():
+        version = _installed_copier_version(venv_dir)
+        if version and version == meta.get("copier_version"):
+            return [str(vpy), "-m", "copier"]
 
-        # Prefer uv if available globally; otherwise use pip
-        have_uv = shutil.which("uv") is not None
+    try:
+        # Stale or missing cache: rebuild from scratch
+        if venv_dir.exists():
+            shutil.rmtree(venv_dir)
+        venv_dir.parent.mkdir(parents=True, exist_ok=True)
+        print(f"[info] Bootstrapping Copier into cached venv: {venv_dir}")
+
+        # Prefer uv if available globally; otherwise use venv + pip
+        have_uv = _which("uv") is not None
         if have_uv:
-            subprocess.check_call(["uv", "pip", "install", "--upgrade", "pip", "copier"])  # installs into global if no venv activated
-            # Ensure copier visible: try binding via the venv python too
-            try:
-                subprocess.check_call([str(vpy), "-m", "pip", "install", "copier"], stdout=subprocess.DEVNULL)
-            except Exception:
-                pass
+            # One tool, one target: uv builds the venv and installs into it, no pip needed
+            subprocess.check_call(["uv", "venv", "--python", python, str(venv_dir)])
+            subprocess.check_call(["uv", "pip", "install", "--python", str(vpy), "copier"])
         else:
+            subprocess.check_call([python, "-m", "venv", str(venv_dir)])
             subprocess.check_call([str(vpy), "-m", "pip", "install", "--upgrade", "pip", "copier"])
 
-        # Verify
-        subprocess.check_call([str(vpy), "-m", "copier", "--version"], stdout=subprocess.DEVNULL)
+        # The install raised if it failed; just record what the cache holds.
+        # Set MLCORE_VERIFY_COPIER (e.g. in CI) to also smoke-test the import.
+        version = _installed_copier_version(venv_dir)
+        if not version:
+            raise SystemExit(f"Copier install not found in bootstrap venv: {venv_dir}")
+        if os.environ.get("MLCORE_VERIFY_COPIER"):
+            subprocess.check_call(
+                [str(vpy), "-m", "copier", "--version"], stdout=subprocess.DEVNULL
+            )
+        meta_path.write_text(
+            json.dumps({"python": python, "copier_version": version}), encoding="utf-8"
+        )
         return [str(vpy), "-m", "copier"]
-    except subprocess.CalledProcessError:
+    except (OSError, subprocess.CalledProcessError):
         raise SystemExit(
             "Copier is not available and auto-bootstrap failed. Install with 'pipx install copier' or 'pip install copier' and retry."
         )
@@ -136,6 +313,36 @@ def venv_paths(venv_dir: Path) -> tuple[Path, Path]:
     return python, pip
 
 
+def create_venv(py: str, venv_dir: Path) -> None:
+    """Create a virtualenv at `venv_dir` for interpreter `py`, seeded with pip.
+
+    Tries, in order:
+      1) `uv venv --seed` (pip comes from uv's wheel cache)
+      2) `virtualenv` (seeds pip from its app-data wheel cache)
+      3) stdlib `venv` (slowest: ensurepip unpacks pip from scratch)
+    """
+    if _which("uv"):
+        try:
+            run(["uv", "venv", "--seed", "--python", py, str(venv_dir)])
+            return
+        except subprocess.CalledProcessError:
+            print("[warn] 'uv venv' failed; falling back to virtualenv/venv")
+
+    try:
+        subprocess.check_call(
+            [py, "-c", "import virtualenv"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    else:
+        run([py, "-m", "virtualenv", str(venv_dir)])
+        return
+
+    run([py, "-m", "venv", str(venv_dir)])
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Create a new project from ml-project-template and set it up.")
 
@@ -219,13 +426,14 @@ def main(argv: list[str] | None = None) -> int:
 
     args = parser.parse_args(argv)
 
-    parent_dir = Path(args.parent_dir).resolve()
+    # Resolve each user-supplied path once; derived paths reuse the absolute parent.
+    parent_dir = Path(args.parent_dir).resolve(strict=False)
     if not parent_dir.exists():
         parser.error(f"parent dir not found: {parent_dir}")
 
     # Determine template ref and path
     if args.source == "local":
-        template_path = Path(args.template_path).resolve()
+        template_path = Path(args.template_path).resolve(strict=False)
         if not template_path.exists():
             parser.error(f"template path not found: {template_path}")
         template_ref = str(template_path)
@@ -233,25 +441,26 @@ def main(argv: list[str] | None = None) -> int:
         template_ref = args.gh_spec
 
     # New project dir (will be created by the template as {{ project_slug }})
-    project_dir = (parent_dir / args.name).resolve()
+    project_dir = parent_dir / args.name
     if project_dir.exists() and any(project_dir.iterdir()):
         parser.error(f"target project dir already exists and is not empty: {project_dir}")
 
-    # Prepare env so post_gen can wire local mlcore if present
-    env = os.environ.copy()
-
     # mlcore install strategy (detect early so we can pass env to copier)
     mlcore_path: Path | None
     if args.mlcore_path is not None:
         if args.mlcore_path.lower() == "none":
             mlcore_path = None
         else:
-            mlcore_path = Path(args.mlcore_path).resolve()
+            mlcore_path = Path(args.mlcore_path).resolve(strict=False)
     else:
         candidate = parent_dir / "mlcore"
         mlcore_path = candidate if candidate.exists() else None
 
+    # Prepare env so post_gen can wire local mlcore if present; otherwise let
+    # Copier inherit our environment untouched (see run()).
+    env: dict[str, str] | None = None
     if mlcore_path and mlcore_path.exists():
+        env = os.environ.copy()
         env["MLCORE_LOCAL_PATH"] = str(mlcore_path)
 
     # Copier copy (interactive prompts by default). Because the template
@@ -260,7 +469,7 @@ def main(argv: list[str] | None = None) -> int:
     # avoid nested dirs like name/name/.
     print(f"[info] Generating project via Copier → {parent_dir} (slug={args.name})")
     copier_cmd = [
-        *find_copier_cmd(repo_root),
+        *find_copier_cmd(),
         "copy",
         "--trust",
         # Ensure we use the latest template state, not an old git tag
@@ -290,17 +499,30 @@ def main(argv: list[str] | None = None) -> int:
         # This helps if Copier partially generated the project but skipped these files.
         try:
             if args.source == "local":
-                tpl_root = Path(args.template_path).resolve()
-                tpl_nbs_dir = tpl_root / "template" / "{{ project_slug }}" / "lab" / "notebooks"
+                tpl_nbs_dir = (
+                    template_path / "template" / "{{ project_slug }}" / "lab" / "notebooks"
+                )
                 if tpl_nbs_dir.exists():
                     nbs_dir.mkdir(parents=True, exist_ok=True)
                     pkg_name = args.name.replace("-", "_")
-                    for j2 in tpl_nbs_dir.glob("*.ipynb.j2"):
-                        target = nbs_dir / j2.name[:-3]  # strip .j2 suffix
-                        txt = j2.read_text(encoding="utf-8")
-                        # Minimal render: substitute package_name placeholder
-                        txt = re.sub(r"{{\s*package_name\s*}}", pkg_name, txt)
-                        target.write_text(txt, encoding="utf-8")
+                    pkg_bytes = pkg_name.encode("utf-8")
+                    with os.scandir(tpl_nbs_dir) as it:
+                        for entry in it:
+                            if not (
+                                entry.name.endswith(".ipynb.j2")
+                                and entry.is_file(follow_symlinks=False)
+                            ):
+                                continue
+                            target = nbs_dir / entry.name[:-3]  # strip .j2 suffix
+                            data = Path(entry.path).read_bytes()
+                            if b"package_name" not in data:
+                                # Nothing to render: let the OS copy it (sendfile/fcopyfile)
+                                shutil.copyfile(entry.path, target)
+                                continue
+                            # Minimal render: substitute package_name placeholder
+                            data = _PKG_NAME_RE.sub(pkg_bytes, data)
+                            with open(target, "wb", buffering=262144) as f:
+                                f.write(data)
                     print(
                         f"[warn] Notebooks directory was missing; wrote fallback notebooks to: {nbs_dir}"
                     )
@@ -332,26 +554,38 @@ def main(argv: list[str] | None = None) -> int:
         py_for_venv = sys.executable
 
     print(f"[info] Creating venv with: {py_for_venv}")
-    run([py_for_venv, "-m", "venv", str(venv_dir)])
-    venv_python, venv_pip = venv_paths(venv_dir)
-
-    # Upgrade pip
-    run([str(venv_python), "-m", "pip", "install", "-U", "pip"]) 
-
-    # If MLCORE_LOCAL_PATH env is set, the template's post_gen may wire pyproject.
-    # We still allow explicit editable install if mlcore_path is present.
+    create_venv(py_for_venv, venv_dir)
+    venv_python, _ = venv_paths(venv_dir)
+
+    # Upgrade pip and install local mlcore + the project in one resolver pass.
+    # If MLCORE_LOCAL_PATH env is set, the template's post_gen may wire pyproject;
+    # we still pass an explicit editable install when mlcore_path is present.
+    if _which("uv"):
+        # Parallel downloads and uv's shared wheel cache
+        install_cmd = ["uv", "pip", "install", "--python", str(venv_python), "-U", "pip"]
+    else:
+        install_cmd = [str(venv_python), "-m", "pip", "install", "-U", "pip"]
     if mlcore_path and mlcore_path.exists():
         print(f"[info] Installing local mlcore editable: {mlcore_path}")
-        run([str(venv_pip), "install", "-e", str(mlcore_path)])
+        install_cmd += ["-e", str(mlcore_path)]
     else:
         print("[info] No local mlcore path provided/detected; skipping editable install.")
-
-    # Install the generated project itself
     print("[info] Installing generated project (editable)")
-    run([str(venv_pip), "install", "-e", "."], cwd=project_dir)
+    install_cmd += ["-e", "."]
+
+    # Determine final flag state across both parser variants
+    enter = getattr(args, "enter", False)
+    if not enter and hasattr(args, "no_enter") and getattr(args, "no_enter"):
+        enter = False
+
+    # When entering a POSIX shell, chain the install into the exec'd shell
+    # command so this Python process is replaced before the install starts.
+    chain_install = enter and os.name != "nt"
+    if not chain_install:
+        run(install_cmd, cwd=project_dir)
 
     # Enter an interactive shell with venv activated unless disabled
-    def spawn_shell() -> None:
+    def spawn_shell(pre_cmd: list[str] | None = None) -> None:
         # Change into the project directory for the user session
         os.chdir(project_dir)
 
@@ -395,16 +629,15 @@ def main(argv: list[str] | None = None) -> int:
             # Source venv and exec a fresh interactive shell with flags
             flags_str = " ".join(flags)
             cmd = f"source '{activate}' && exec {shell_path} {flags_str}"
+            if pre_cmd:
+                # Shell only starts if the chained command succeeds
+                print(f"[cmd] {shlex.join(pre_cmd)}  (cwd={project_dir})")
+                cmd = f"{shlex.join(pre_cmd)} && {cmd}"
             os.execvp(shell_path, [shell_path, "-c", cmd])
 
-    # Determine final flag state across both parser variants
-    enter = getattr(args, "enter", False)
-    if not enter and hasattr(args, "no_enter") and getattr(args, "no_enter"):
-        enter = False
-
     if enter:
         print("\n[enter] Opening an interactive shell in the project with venv activated…")
-        spawn_shell()
+        spawn_shell(install_cmd if chain_install else None)
         return 0  # Unreachable: exec replaces the process, but keep flow explicit
     else:
         print("\n[done] Project ready!")
@@ -7,13 +7,25 @@ from __future__ import annotations
 
 import argparse
 import os
-import subprocess
 import sys
-import toml
 from pathlib import Path
 import re
 
 
+# Normalized (PEP 503) names under which the template may declare mlcore
+_MLCORE_NAMES = frozenset({"mlcore", "ml-core"})
+# Match both 'mlcore' and 'ml-core' names with optional extras
+_MLCORE_DEP_RE = re.compile(r"^\s*ml[-_]?core(\[[^\]]+\])?(\s*.*)?$", re.IGNORECASE)
+_REQ_NAME_END_RE = re.compile(r"[<>=!~;@\[\s]")
+_NAME_SEP_RE = re.compile(r"[-_.]+")
+
+
+def _dep_name(dep: str) -> str:
+    """Return the PEP 503-normalized project name of a requirement string."""
+    name = _REQ_NAME_END_RE.split(dep.strip(), maxsplit=1)[0]
+    return _NAME_SEP_RE.sub("-", name).lower()
+
+
 def update_pyproject_with_conditional_deps():
     """Update pyproject.toml after generation.
 
@@ -22,82 +34,135 @@ def update_pyproject_with_conditional_deps():
       uv source for mlcore: `[tool.uv.sources] mlcore = { path = ..., editable = true }`.
     """
     try:
+        # Imported here rather than at module level: only this step needs it.
+        # Inside the try, so a missing PyYAML degrades to the warning below.
+        import yaml
+
         project_dir = Path.cwd()
         pyproject_path = project_dir / "pyproject.toml"
         
-        # Read the current pyproject.toml
-        with open(pyproject_path, 'r') as f:
-            data = toml.load(f)
-        
         # Get Copier answers to check user choices
+        use_prefect = use_pandera = False
         answers_path = project_dir / ".copier-answers.yml"
         if answers_path.exists():
-            # Simple parsing of copier answers (you could use pyyaml for better parsing)
-            with open(answers_path, 'r') as f:
-                answers_content = f.read()
-            
+            # Copier writes the answers as YAML; pyyaml ships with Copier
+            with open(answers_path, encoding="utf-8") as f:
+                answers = yaml.safe_load(f) or {}
+
             # Check user choices from answers
-            use_prefect = 'use_prefect: true' in answers_content.lower()
-            use_pandera = 'use_pandera: true' in answers_content.lower()
-            
-            # Get dependencies list
-            if 'project' in data and 'dependencies' in data['project']:
-                dependencies = data['project']['dependencies']
-                
-                # Add prefect if requested
-                if use_prefect and "prefect>=2.16.0" not in str(dependencies):
-                    dependencies.append("prefect>=2.16.0")
-                
-                # Add pandera if requested  
-                if use_pandera and "pandera>=0.18.0" not in str(dependencies):
-                    dependencies.append("pandera>=0.18.0")
-                
-                # Update the dependencies
-                data['project']['dependencies'] = dependencies
-                
-        # Optionally wire local mlcore for both uv and pip
+            use_prefect = bool(answers.get("use_prefect"))
+            use_pandera = bool(answers.get("use_pandera"))
+
         mlcore_local = os.getenv("MLCORE_LOCAL_PATH")
+        if not (use_prefect or use_pandera or mlcore_local):
+            # Nothing to add: leave pyproject.toml untouched
+            return
+
+        # Only needed once there is something to write
+        import shutil
+        import tempfile
+        import tomllib
+
+        import tomli_w
+
+        # Read the current pyproject.toml
+        with open(pyproject_path, 'rb') as f:
+            data = tomllib.load(f)
+
+        # Normalized names of the declared dependencies, for O(1) membership checks
+        existing = {
+            _dep_name(d) for d in data.get("project", {}).get("dependencies", [])
+            if isinstance(d, str)
+        }
+
+        # Track whether anything actually changed; skip the rewrite otherwise
+        dirty = False
+
+        # Get dependencies list
+        if 'project' in data and 'dependencies' in data['project']:
+            dependencies = data['project']['dependencies']
+
+            # Add prefect if requested
+            if use_prefect and "prefect" not in existing:
+                dependencies.append("prefect>=2.16.0")
+                dirty = True
+
+            # Add pandera if requested
+            if use_pandera and "pandera" not in existing:
+                dependencies.append("pandera>=0.18.0")
+                dirty = True
+
+            # Update the dependencies
+            data['project']['dependencies'] = dependencies
+
+        # Optionally wire local mlcore for both uv and pip
         if mlcore_local:
             # uv: add local source mapping (used by `uv sync`)
             tool = data.setdefault("tool", {})
             uv = tool.setdefault("uv", {})
             sources = uv.setdefault("sources", {})
-            sources["mlcore"] = {"path": mlcore_local, "editable": True}
+            mlcore_source = {"path": mlcore_local, "editable": True}
+            if sources.get("mlcore") != mlcore_source:
+                sources["mlcore"] = mlcore_source
+                dirty = True
 
             # pip: replace any 'mlcore...' dependency with a direct path reference
             try:
-                abs_path = Path(mlcore_local)
-                if not abs_path.is_absolute():
-                    abs_path = (project_dir / abs_path).resolve()
+                # Purely lexical: a file:// reference doesn't need symlinks resolved
+                if os.path.isabs(mlcore_local):
+                    abs_path = mlcore_local
+                else:
+                    abs_path = os.path.abspath(os.path.join(project_dir, mlcore_local))
                 file_ref = f"file://{abs_path}"
 
                 deps = data.get("project", {}).get("dependencies", [])
                 new_deps: list[str] = []
-                # Match both 'mlcore' and 'ml-core' names with optional extras
-                pattern = re.compile(r"^\s*ml[-_]?core(\[[^\]]+\])?(\s*.*)?$", re.IGNORECASE)
                 replaced = False
-                for dep in deps:
-                    if isinstance(dep, str):
-                        m = pattern.match(dep)
-                        if m:
-                            extras = m.group(1) or ""
-                            # Normalize name to mlcore
-                            new_deps.append(f"mlcore{extras} @ {file_ref}")
-                            replaced = True
-                            continue
-                    new_deps.append(dep)
-                if replaced:
-                    data.setdefault("project", {})["dependencies"] = new_deps
+                if existing.isdisjoint(_MLCORE_NAMES):
+                    # Nothing to rewrite; skip the per-dependency regex scan
+                    new_deps.extend(deps)
                 else:
+                    for dep in deps:
+                        if isinstance(dep, str):
+                            m = _MLCORE_DEP_RE.match(dep)
+                            if m:
+                                extras = m.group(1) or ""
+                                # Normalize name to mlcore
+                                new_deps.append(f"mlcore{extras} @ {file_ref}")
+                                replaced = True
+                                continue
+                        new_deps.append(dep)
+                if not replaced:
                     # If no existing mlcore dep, append a direct path reference
                     new_deps.append(f"mlcore @ {file_ref}")
+                if new_deps != deps:
                     data.setdefault("project", {})["dependencies"] = new_deps
+                    dirty = True
             except Exception as exc:  # noqa: BLE001
                 print(f"⚠️  Could not rewrite mlcore dependency for pip: {exc}")
 
-        # Write back the modified pyproject.toml if we changed anything
-        with open(pyproject_path, 'w') as f:
-            toml.dump(data, f)
+        if not dirty:
+            return
+
+        # Write back atomically: dump to a sibling temp file, then rename over
+        # pyproject.toml so other hooks never observe a partial file.
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=project_dir, prefix=".pyproject.", suffix=".tmp", delete=False
+        ) as tmp:
+            tmp_name = tmp.name
+            try:
+                tomli_w.dump(data, tmp)
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp_name)
+                raise
+        try:
+            shutil.copymode(pyproject_path, tmp_name)  # keep the original permissions
+            os.replace(tmp_name, pyproject_path)
+        except BaseException:
+            # Don't leave the temp file behind in the generated project
+            os.unlink(tmp_name)
+            raise
 
         print("✅ Updated pyproject.toml with conditional deps and local sources (if any)")
         
@@ -131,6 +196,8 @@ def main(argv: list[str] | None = None) -> int:
     print(msg)
 
     if args.install:
+        import subprocess
+
         try:
             subprocess.check_call([sys.executable, "-m", "pre_commit", "install"])  # type: ignore[attr-defined]
         except Exception as exc:  # noqa: BLE001
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from ..project_config import get_settings  # project settings entrypoint
-
 # Deploy
 
 try:
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from ..project_config import get_settings  # project settings entrypoint
-
 try:
     from prefect import flow, task  # type: ignore
 except Exception:  # pragma: no cover
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from typing import Any, Dict
-from ..project_config import get_settings  # project settings entrypoint
 
 try:
     from prefect import flow, task  # type: ignore
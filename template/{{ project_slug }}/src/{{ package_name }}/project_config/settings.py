@@ -1,33 +1,60 @@
 from __future__ import annotations
 
+import copy
 import os
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-import yaml
+
+
+# ------------------------- Filesystem discovery ------------------------- #
+# Resolved on first use (not at import) and cached for the process lifetime.
+
+
+@lru_cache
+def _project_root() -> Path:
+    return Path(__file__).resolve().parents[3]
+
+
+@lru_cache
+def _config_root() -> Path:
+    return _project_root() / "app_config"
+
+
+@lru_cache
+def _config_root_present() -> bool:
+    # Config presence is stable for a process's lifetime; check it once
+    return _config_root().is_dir()
+
+
+def _env_files() -> tuple[str, ...]:
+    return tuple(str(p) for p in [_project_root() / ".env"] if p.exists())
 
 
 class PathsSettings(BaseModel):
-    project_root: Path = Field(
-        default_factory=lambda: Path(__file__).resolve().parents[3]
-    )
+    project_root: Path = Field(default_factory=_project_root)
     data_root: Path = Path("data")
     config_root: Path = Path("app_config")
     cache_root: Path = Path(".cache")
 
-    @model_validator(mode="after")
-    def _absolutize(self) -> "PathsSettings":
-        pr = self.project_root
-        if not self.data_root.is_absolute():
-            self.data_root = pr / self.data_root
-        if not self.cache_root.is_absolute():
-            self.cache_root = pr / self.cache_root
-        if not self.config_root.is_absolute():
-            self.config_root = pr / self.config_root
-        return self
+    # Run the validator below on defaults too, so they are absolutized as well
+    model_config = ConfigDict(validate_default=True)
+
+    @field_validator("data_root", "cache_root", "config_root", mode="before")
+    @classmethod
+    def _absolutize(cls, v: Any, info: ValidationInfo) -> Any:
+        # Leave non-path input to pydantic so it raises a proper ValidationError
+        if not isinstance(v, (str, os.PathLike)):
+            return v
+        # Relative paths hang off project_root (declared first, so already validated)
+        p = Path(v)
+        if p.is_absolute():
+            return p
+        pr = info.data.get("project_root") or _project_root()
+        return pr / p
 
 
 class DataSettings(BaseModel):
@@ -63,7 +90,8 @@ class ProjectSettings(BaseSettings):
     environment: str = "dev"
     debug: bool = False
 
-    paths: PathsSettings = PathsSettings()
+    # Built per instance so importing this module doesn't touch the filesystem
+    paths: PathsSettings = Field(default_factory=PathsSettings)
     data: DataSettings = DataSettings()
     model: ModelSettings = ModelSettings()
     logging: LoggingSettings = LoggingSettings()
@@ -73,10 +101,15 @@ class ProjectSettings(BaseSettings):
     model_config = SettingsConfigDict(
         env_prefix="PRJ_",
         env_nested_delimiter="__",
-        env_file=(),  # set below after constants are defined
+        env_file=(),  # discovered lazily; see __init__
         env_file_encoding="utf-8",
     )
 
+    def __init__(self, **values: Any) -> None:
+        # Discover .env on construction rather than at import time
+        values.setdefault("_env_file", _env_files())
+        super().__init__(**values)
+
     @classmethod
     def settings_customise_sources(
         cls,
@@ -103,17 +136,6 @@ def get_settings() -> ProjectSettings:
 
 # ------------------------- YAML hydration helpers ------------------------- #
 
-DEFAULT_PROJECT_ROOT = Path(__file__).resolve().parents[3]
-DEFAULT_CONFIG_ROOT = DEFAULT_PROJECT_ROOT / "app_config"
-
-# Discover env files once at import time (simple, robust)
-ENV_FILES = tuple(
-    str(p) for p in [DEFAULT_PROJECT_ROOT / ".env"] if p.exists()
-)
-
-# Inject discovered env files into model_config (must be a tuple of paths/strings)
-ProjectSettings.model_config["env_file"] = ENV_FILES
-
 
 def yaml_settings_source() -> Dict[str, Any]:
     """Load overrides from app_config YAMLs.
@@ -124,44 +146,93 @@ def yaml_settings_source() -> Dict[str, Any]:
 
     YAML keys are mapped into ProjectSettings' nested structure. Environment
     variables still override these values due to source precedence.
+
+    Parsed results are memoized per (env, file mtimes), so repeated
+    ProjectSettings() construction only re-reads YAML after a file changes.
     """
 
+    if not _config_root_present():
+        return {}
+
     env = os.getenv("PRJ_ENVIRONMENT") or os.getenv("ENVIRONMENT") or "dev"
-    cfg_root = DEFAULT_CONFIG_ROOT
+    cfg_root = _config_root()
+    env_file = cfg_root / "env" / f"{env}.yaml"
+    thresholds_file = cfg_root / "policies" / "thresholds.yaml"
+
+    overrides = _load_yaml_overrides(env, _mtime_ns(env_file), _mtime_ns(thresholds_file))
+    # Hand out a copy so callers can't mutate the cached overrides
+    return copy.deepcopy(overrides)
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+@lru_cache(maxsize=4)
+def _load_yaml_overrides(env: str, env_mtime_ns: int, thresholds_mtime_ns: int) -> Dict[str, Any]:
+    # The mtimes are only part of the cache key: a changed file misses the cache.
+    cfg_root = _config_root()
 
     overrides: Dict[str, Any] = {}
 
     # env-level file
     env_file = cfg_root / "env" / f"{env}.yaml"
-    overrides = _merge_dicts(overrides, _map_env_yaml(_read_yaml(env_file)))
+    overrides = _merge_dicts(
+        overrides, _map_env_yaml(_read_yaml_cached(str(env_file), env_mtime_ns))
+    )
 
     # thresholds/policies
     thresholds_file = cfg_root / "policies" / "thresholds.yaml"
-    overrides = _merge_dicts(overrides, _map_thresholds_yaml(_read_yaml(thresholds_file)))
+    overrides = _merge_dicts(
+        overrides,
+        _map_thresholds_yaml(_read_yaml_cached(str(thresholds_file), thresholds_mtime_ns)),
+    )
 
     return overrides
 
 
-def _read_yaml(path: Path) -> Dict[str, Any]:
-    if not path.exists():
+@lru_cache(maxsize=32)
+def _read_yaml_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    # Keyed on mtime so an edited file is re-parsed. The result is shared
+    # between callers: treat it as read-only.
+    if mtime_ns < 0:
+        # _mtime_ns already found the file missing; no need to try opening it
         return {}
+    # Deferred so importing settings (e.g. via the CLI) doesn't pull in PyYAML
+    import yaml
+
+    # libyaml-backed C loader (~10x faster, bundled with most PyYAML wheels),
+    # else the pure-Python one
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        if not isinstance(data, dict):
-            return {}
-        return data
-    except Exception:
+        # EAFP: open directly instead of exists() + open()
+        with open(path_str, encoding="utf-8") as f:
+            data = yaml.load(f, Loader=loader) or {}
+    except Exception:  # includes a file removed since the stat
         return {}
+    if not isinstance(data, dict):
+        return {}
+    return data
 
 
 def _merge_dicts(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+    """Deep-merge `b` into a copy of `a` (b wins). Neither input is mutated."""
     out = dict(a)
-    for k, v in b.items():
-        if k in out and isinstance(out[k], dict) and isinstance(v, dict):
-            out[k] = _merge_dicts(out[k], v)
-        else:
-            out[k] = v
+    stack = [(out, b)]
+    while stack:
+        dst, src = stack.pop()
+        for k, v in src.items():
+            existing = dst.get(k)
+            if isinstance(existing, dict) and isinstance(v, dict):
+                # Copy only the nested dicts that are actually merged into
+                merged = dict(existing)
+                dst[k] = merged
+                stack.append((merged, v))
+            else:
+                dst[k] = v
     return out
 
 
@@ -185,22 +256,21 @@ def _map_env_yaml(d: Dict[str, Any]) -> Dict[str, Any]:
 
     logging = d.get("logging") or {}
     if isinstance(logging, dict) and "level" in logging:
-        out.setdefault("logging", {})
-        out["logging"]["level"] = logging["level"]
+        out["logging"] = {"level": logging["level"]}
 
     data = d.get("data") or {}
     if isinstance(data, dict) and "root" in data:
-        out.setdefault("paths", {})
-        out["paths"]["data_root"] = data["root"]
+        out["paths"] = {"data_root": data["root"]}
 
     pipeline = d.get("pipeline") or {}
     if isinstance(pipeline, dict):
+        data_out: Dict[str, Any] = {}
         if "num_workers" in pipeline:
-            out.setdefault("data", {})
-            out["data"]["num_workers"] = pipeline["num_workers"]
+            data_out["num_workers"] = pipeline["num_workers"]
         if "chunk_tokens" in pipeline:
-            out.setdefault("data", {})
-            out["data"]["chunk_tokens"] = pipeline["chunk_tokens"]
+            data_out["chunk_tokens"] = pipeline["chunk_tokens"]
+        if data_out:
+            out["data"] = data_out
 
     return out
 
@@ -218,18 +288,20 @@ def _map_thresholds_yaml(d: Dict[str, Any]) -> Dict[str, Any]:
     if not d:
         return out
 
+    # Every key maps under "data": fill one dict and attach it once
+    data_out: Dict[str, Any] = {}
+
     validation = d.get("validation") or {}
     if isinstance(validation, dict):
         if "min_rows" in validation:
-            out.setdefault("data", {})
-            out["data"]["min_rows"] = validation["min_rows"]
+            data_out["min_rows"] = validation["min_rows"]
         if "max_missing" in validation:
-            out.setdefault("data", {})
-            out["data"]["max_missing"] = validation["max_missing"]
+            data_out["max_missing"] = validation["max_missing"]
 
     rag = d.get("rag") or {}
     if isinstance(rag, dict) and "chunk_tokens" in rag:
-        out.setdefault("data", {})
-        out["data"].setdefault("chunk_tokens", rag["chunk_tokens"])  # don't override if already set
+        data_out.setdefault("chunk_tokens", rag["chunk_tokens"])  # don't override if already set
 
+    if data_out:
+        out["data"] = data_out
     return out